@@ -1,8 +1,14 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 import seaborn as sns
+import matplotlib
+matplotlib.use("Agg") # plots are only saved to file
 import matplotlib.pyplot as plt
 from matplotlib.dates import DateFormatter
+from pyarrow import csv as pacsv, parquet as pq
 
 from parse import get_var
 from process import detrend_signal, taper_signal, calc_spectrum, roll_mean
@@ -11,10 +17,10 @@ from setup import all_puos, variables, metadata, window_functions, unique_dates,
 
 
 grid_kwargs =           {"color":"lightgrey", "lw":0.4}
-line_kwargs =           {"color":"mediumblue", "lw":0.6}
+line_kwargs =           {"color":"mediumblue", "lw":0.6, "rasterized":True}
 smooth_spec_kw_args =   {"lw": 1.0, "alpha": 0.5, "c": "r"}
 title_kwargs =          {"fontweight":"bold", "fontsize":12, "color":"grey", "y":1.05}
-scat_kw_args =          {"s": 1.0, "alpha": 0.6, "c": "darkgrey"}
+scat_kw_args =          {"s": 1.0, "alpha": 0.6, "c": "darkgrey", "rasterized": True}
 range_kw_args =         {"alpha": 0.1, "color": "orange"}
 
 rename_dict = {
@@ -24,14 +30,68 @@ rename_dict = {
             "SONIC_wind_z": "Vertikalwind \n(SONIC)"
             }    
 
+# spectra columns of the comparison data (file order)
+spec_cols = ["EXPE_t", "SONIC_t", "SONIC_wind_z", "SONIC_wind_h"]
+
 first_n = 300 # reduce spectra to first 300 rows
 
+# resolution of saved figures, set PLOT_DPI=600 for final exports
+SAVE_DPI = int(os.environ.get("PLOT_DPI", 150))
+
+def _spec_df(
+        puo: str, device: str, 
+        columns: list[str] | None = None, nrows: int | None = None
+        ) -> pd.DataFrame:
+    """
+    Return the spectra data of a PUO for a device ("EXPE", "SONIC" or 
+    "comparison"), optionally only the first nrows rows. The csv-file is 
+    converted once to a parquet-file next to it, which is re-created 
+    whenever the csv-file is newer.
+    """
+    csv_fn = f"data/spectra_data/{puo}_{device}_spectrum_data.csv"
+    parquet_fn = csv_fn.replace(".csv", ".parquet")
+    
+    if not os.path.exists(parquet_fn) or \
+            os.path.getmtime(parquet_fn) < os.path.getmtime(csv_fn):
+        table = pacsv.read_csv(csv_fn)
+        table = table.cast(pa.schema([(col, pa.float32()) for col in table.column_names]))
+        
+        # write to a temporary file first, parallel workers may build the same cache
+        tmp_fn = f"{parquet_fn}.{os.getpid()}.tmp"
+        pq.write_table(table, tmp_fn)
+        os.replace(tmp_fn, parquet_fn)
+    
+    if nrows is not None:
+        # read only the first batch instead of the whole file
+        batch = next(pq.ParquetFile(parquet_fn).iter_batches(batch_size=nrows, columns=columns))
+        df = batch.to_pandas()
+        return df[columns] if columns is not None else df
+    
+    return pd.read_parquet(parquet_fn, engine="pyarrow", columns=columns)
+
+def _style_spec_ax(ax: plt.Axes, sec_pos: float | None = None) -> None:
+    """
+    Configure the logarithmic frequency axis of a spectrum plot and, if 
+    sec_pos is given, add a secondary axis with the period at that position.
+    """
+    ax.set_xscale("log")
+    ax.set_xlim((1e-4, 1e-1))
+    ax.set_xticks([1e-4, 1e-3, 1e-2, 1e-1])
+    
+    if sec_pos is not None:
+        ax2 = ax.secondary_xaxis(sec_pos, functions=(np.reciprocal, np.reciprocal))
+        ax2.set_xticks([1e4, 1e3, 1e2, 1e1])
+        ax2.set_xlabel("Periodendauer [s]")
+
 def plot_ts(
         x: np.ndarray, y: np.ndarray,
         fn: str, title: str
         ) -> None:
     """Plots the processing steps (raw, detrend, taper) of a time series."""
     
+    y_det = detrend_signal(y)
+    y_tap = taper_signal(y_det, 0.1)
+    
     fig, ax = plt.subplots(nrows=3, ncols=1, sharex=True, figsize=(9,6), 
                            gridspec_kw={'hspace': 0.4})
     
@@ -39,9 +99,9 @@ def plot_ts(
     ax[0].set_title("A. Originale Zeitreihe", loc="left")
     ax[0].plot(x, y, **line_kwargs)
     ax[1].set_title("B. Zeitreihe nach Trendbereinigung", loc="left")
-    ax[1].plot(x, detrend_signal(y), **line_kwargs)
+    ax[1].plot(x, y_det, **line_kwargs)
     ax[2].set_title("C. Zeitreihe nach Tapering", loc="left")
-    ax[2].plot(x, taper_signal(detrend_signal(y), 0.1), **line_kwargs)
+    ax[2].plot(x, y_tap, **line_kwargs)
     
     # plot config
     fig.suptitle(title, **title_kwargs)
@@ -51,7 +111,7 @@ def plot_ts(
         ax[row_i].set_xlim(x[0], x[-1])
         ax[row_i].grid(True, **grid_kwargs)
     
-    plt.savefig(f"plots/preprocessing/preprocess_{fn}.png", dpi=600, bbox_inches="tight")
+    plt.savefig(f"plots/preprocessing/preprocess_{fn}.png", dpi=SAVE_DPI, bbox_inches="tight")
     plt.close()
     
 def plot_spectrum(
@@ -78,22 +138,41 @@ def plot_spectrum(
     ax[0].set_ylabel(ylabel)
     ax[1].set_xlabel("Frequenz [Hz]")
     ax[1].set_ylabel("Spektrale Energiedichte * Frequenz")
-    ax[1].set_xscale("log")
-    ax[1].set_xlim((1e-4, 1e-1))
-    ax[1].set_xticks([1e-4, 1e-3, 1e-2, 1e-1])
-    ax2 = ax[1].secondary_xaxis(-0.3, functions=(lambda x: 1/x, lambda x: 1/x))
-    ax2.set_xticks([10000, 1000, 100, 10])
-    ax2.set_xlabel("Periodendauer [s]")
+    _style_spec_ax(ax[1], sec_pos=-0.3)
     
     for i in [0,1]:
         ax[i].grid(True)
         ax[i].legend(loc="upper left", fontsize=12)
         
-    plt.savefig(f"plots/spectra/spec_{fn}.png", dpi=600, bbox_inches="tight")
+    plt.savefig(f"plots/spectra/spec_{fn}.png", dpi=SAVE_DPI, bbox_inches="tight")
     plt.close()
     
-def plot_spectrum_comp(device: str) -> None:
-    """Plots a comparison of all smoothed spectra."""
+def _setup_grid() -> tuple[plt.Figure, np.ndarray]:
+    """
+    Create the 3x4 grid of the spectra comparison plots with one configured 
+    panel (title, axes, 30 min - 60 min range) per PUO.
+    """
+    
+    fig, ax = plt.subplots(3, 4, figsize=(19, 11), sharex=False, sharey=False)
+    
+    for i, puo in enumerate(all_puos):
+        ax[i // 4, i % 4].axvspan(1/(60*30), 1/(60*60), label="30 min - 60 min", 
+                                  **range_kw_args)
+        
+        _, _, start_datetime, end_datetime, date, _ = metadata(puo)
+        ax[i // 4, i % 4].set_title(f"{date}: {start_datetime[10:-3]} - {end_datetime[10:-3]}", **title_kwargs)
+        
+        _style_spec_ax(ax[i // 4, i % 4], sec_pos=-0.35)
+        ax[i // 4, i % 4].set_xlabel("Frequenz [Hz]")
+        ax[i // 4, i % 4].grid()
+    
+    fig.text(-0.02, 0.5, "Spektrale Energiedichte * Frequenz", va='center', rotation='vertical', fontsize=12)
+    ax[2, 3].axis('off')
+    
+    return fig, ax
+
+def _plot_spectrum_comp_var(device: str, var: str) -> None:
+    """Plots a comparison of all smoothed spectra of a single variable."""
     
     labels = {
         "t_spec": "Temperatur [°C]",
@@ -101,90 +180,61 @@ def plot_spectrum_comp(device: str) -> None:
         "wind_z_spec": "Vertikalwind [m/s]"
         }
     
-    for var in variables[device]:
-        var = var+"_spec"
-        fig, ax = plt.subplots(3, 4, figsize=(19, 11), sharex=False, sharey=False)
-        fig.suptitle(labels[var]+f"\n\n({device}, {SAMPLE_RATE[device]} Hz)", **title_kwargs)
+    fig, ax = _setup_grid()
+    fig.suptitle(labels[var]+f"\n\n({device}, {SAMPLE_RATE[device]} Hz)", **title_kwargs)
+
+    for i, puo in enumerate(all_puos):
+        df = _spec_df(puo, device, columns=["frequencies", var])
+        
+        # plot data            
+        ax[i // 4, i % 4].plot(df["frequencies"], df[var], ls="none", marker="o", ms=0.7, 
+                               mew=0, alpha=0.5, color="grey", label="Spektrum", rasterized=True)
+        ax[i // 4, i % 4].plot(df["frequencies"], roll_mean(df[var], win_len=10), 
+                               lw=0.5, c="r", rasterized=True, label=f"Gleitendes Mittel (Fensterbreite={KERNEL_SIZE})")
+        
+    plt.tight_layout()
+    plt.savefig(f"plots/spectra_comparison/spectra_temporal_comparison_{device}_{var}.png", dpi=SAVE_DPI, bbox_inches="tight")
+    plt.close()
+
+def plot_spectrum_comp(device: str) -> None:
+    """Plots a comparison of all smoothed spectra, one figure per variable."""
     
-        for i, puo in enumerate(all_puos):
-            df = pd.read_csv(f"data/spectra_data/{puo}_{device}_spectrum_data.csv")
-            
-            # plot data            
-            lns1 = ax[i // 4, i % 4].scatter(df["frequencies"], df[var], s=0.5, alpha=0.5, 
-                                     color="grey", label="Spektrum")
-            lns2 = ax[i // 4, i % 4].plot(df["frequencies"], roll_mean(df[var], win_len=10), 
-                                  lw=0.5, c="r", label=f"Gleitendes Mittel (Fensterbreite={KERNEL_SIZE})")
-            lns3 = ax[i // 4, i % 4].axvspan(1/(60*30), 1/(60*60), label="30 min - 60 min", 
-                                     **range_kw_args)
-            
-            # plot setup
-            _, _, start_datetime, end_datetime, date, _ = metadata(puo)
-            ax[i // 4, i % 4].set_title(f"{date}: {start_datetime[10:-3]} - {end_datetime[10:-3]}", **title_kwargs)
-            
-            ax[i // 4, i % 4].set_xlim((1e-4, 1e-1))
-            ax[i // 4, i % 4].set_xticks([1e-4, 1e-3, 1e-2, 1e-1])
-            ax[i // 4, i % 4].set_xscale("log")
-            ax[i // 4, i % 4].set_xlabel("Frequenz [Hz]")
-            ax[i // 4, i % 4].grid()
-            ax[2, 3].axis('off')
-            ax2 = ax[i // 4, i % 4].secondary_xaxis(-0.35, functions=(lambda x: 1/x, lambda x: 1/x))
-            ax2.set_xticks([10000, 1000, 100, 10])
-            ax2.set_xlabel("Periodendauer [s]")
-            
-        fig.text(-0.02, 0.5, "Spektrale Energiedichte * Frequenz", va='center', rotation='vertical', fontsize=12)
-        plt.tight_layout()
-        plt.savefig(f"plots/spectra_comparison/spectra_temporal_comparison_{device}_{var}.png", dpi=600, bbox_inches="tight")
-        plt.close()
+    spec_vars = [var+"_spec" for var in variables[device]]
+    
+    if len(spec_vars) == 1:
+        _plot_spectrum_comp_var(device, spec_vars[0])
+        return
+    
+    with ProcessPoolExecutor(max_workers=len(spec_vars)) as ex:
+        list(ex.map(_plot_spectrum_comp_var, [device]*len(spec_vars), spec_vars))
 
 def plot_spectrum_comp_all() -> None:
     """Plots a comparison of all smoothed spectra for both devices."""
     
-    fig, ax = plt.subplots(3, 4, figsize=(19, 11), sharex=False, sharey=False)
+    fig, ax = _setup_grid()
 
     for i, puo in enumerate(all_puos):
         
-        ax[i // 4, i % 4].axvspan(1/(60*30), 1/(60*60), label="30 min - 60 min", 
-                                    **range_kw_args)
+        # read spectra data once per PUO
+        expe_df = _spec_df(puo, "EXPE", columns=["frequencies", "t_spec"])
+        sonic_df = _spec_df(puo, "SONIC", 
+                            columns=["frequencies", "t_spec", "wind_h_spec", "wind_z_spec"])
         
         # EXPE temp
-        df = pd.read_csv(f"data/spectra_data/{puo}_EXPE_spectrum_data.csv")
-        ln1 = ax[i // 4, i % 4].plot(df["frequencies"], roll_mean(df["t_spec"], win_len=10), 
-                        lw=0.5, c="darkorange", ls="-", label="Temperatur in °C (EXPE, 1 Hz)")
+        ln1 = ax[i // 4, i % 4].plot(expe_df["frequencies"], roll_mean(expe_df["t_spec"], win_len=10), 
+                        lw=0.5, c="darkorange", rasterized=True, ls="-", label="Temperatur in °C (EXPE, 1 Hz)")
         # SONIC temp
-        df = pd.read_csv(f"data/spectra_data/{puo}_SONIC_spectrum_data.csv")
-        ln2 = ax[i // 4, i % 4].plot(df["frequencies"], roll_mean(df["t_spec"], win_len=10), 
-                        lw=0.5, c="r", ls="-", label="Temperatur in °C (SONIC, 2 Hz)")
+        ln2 = ax[i // 4, i % 4].plot(sonic_df["frequencies"], roll_mean(sonic_df["t_spec"], win_len=10), 
+                        lw=0.5, c="r", rasterized=True, ls="-", label="Temperatur in °C (SONIC, 2 Hz)")
             
         # horizontal wind
-        df = pd.read_csv(f"data/spectra_data/{puo}_SONIC_spectrum_data.csv")
-        ln1 = ax[i // 4, i % 4].plot(df["frequencies"], roll_mean(df["wind_h_spec"], win_len=10), 
-                        lw=0.5, c="b", label="Horizontalwind in m/s (2 Hz)")
+        ln1 = ax[i // 4, i % 4].plot(sonic_df["frequencies"], roll_mean(sonic_df["wind_h_spec"], win_len=10), 
+                        lw=0.5, c="b", rasterized=True, label="Horizontalwind in m/s (2 Hz)")
         
         # vertical wind
-        df = pd.read_csv(f"data/spectra_data/{puo}_SONIC_spectrum_data.csv")
-        ln2 = ax[i // 4, i % 4].plot(df["frequencies"], roll_mean(df["wind_z_spec"], win_len=10), 
-                        lw=0.5, c="g", label="Vertikalwind in m/s (2 Hz)")
-        
-        _, _, start_datetime, end_datetime, date, _ = metadata(puo)
-        ax[i // 4, i % 4].set_title(f"{date}: {start_datetime[10:-3]} - {end_datetime[10:-3]}", **title_kwargs)
-        
-        ax[i // 4, i % 4].set_xlim((1e-4, 1e-1))
-        ax[i // 4, i % 4].set_xticks([1e-4, 1e-3, 1e-2, 1e-1])
-        ax[i // 4, i % 4].set_xscale("log")
-        ax[i // 4, i % 4].set_xlabel("Frequenz [Hz]")
-        ax[i // 4, i % 4].grid()
+        ln2 = ax[i // 4, i % 4].plot(sonic_df["frequencies"], roll_mean(sonic_df["wind_z_spec"], win_len=10), 
+                        lw=0.5, c="g", rasterized=True, label="Vertikalwind in m/s (2 Hz)")
         
-        ax2 = ax[i // 4, i % 4].secondary_xaxis(-0.35, functions=(lambda x: 1/x, lambda x: 1/x))
-        ax2.set_xticks([10000, 1000, 100, 10])
-        ax2.set_xlabel("Periodendauer [s]")
-    
-    
-    fig.text(-0.02, 0.5, "Spektrale Energiedichte * Frequenz", va='center', rotation='vertical', fontsize=12)
-    
-    # ax[2, 3].set_visible(False)        
-    ax[2, 3].axis('off')
-        
-    # ax[0, 0].legend(loc='upper right')
     lns = ln1+ln2
     labs = [l.get_label() for l in lns]
     leg = ax[2, 3].legend(lns, labs, loc="center", fontsize="14")
@@ -192,45 +242,27 @@ def plot_spectrum_comp_all() -> None:
         line.set_linewidth(4.0)
             
     plt.tight_layout()
-    plt.savefig(f"plots/spectra_comparison/spectra_temporal_comparison.png", dpi=600, bbox_inches="tight")
+    plt.savefig(f"plots/spectra_comparison/spectra_temporal_comparison.png", dpi=SAVE_DPI, bbox_inches="tight")
     plt.close()
 
 def plot_wind_spectrum_comp() -> None:
     """Plots a comparison of all smoothed spectra for both devices."""
     
-    fig, ax = plt.subplots(3, 4, figsize=(19, 11), sharex=False, sharey=False)
+    fig, ax = _setup_grid()
 
     for i, puo in enumerate(all_puos):
         
-        ax[i // 4, i % 4].axvspan(1/(60*30), 1/(60*60), label="30 min - 60 min", 
-                                    **range_kw_args)
+        # read spectra data once per PUO
+        sonic_df = _spec_df(puo, "SONIC", columns=["frequencies", "wind_h_spec", "wind_z_spec"])
         
         # horizontal wind
-        df = pd.read_csv(f"data/spectra_data/{puo}_SONIC_spectrum_data.csv")
-        ln1 = ax[i // 4, i % 4].plot(df["frequencies"], roll_mean(df["wind_h_spec"], win_len=10), 
-                        lw=0.5, c="b", label="Horizontalwind in m/s (2 Hz)")
+        ln1 = ax[i // 4, i % 4].plot(sonic_df["frequencies"], roll_mean(sonic_df["wind_h_spec"], win_len=10), 
+                        lw=0.5, c="b", rasterized=True, label="Horizontalwind in m/s (2 Hz)")
         
         # vertical wind
-        df = pd.read_csv(f"data/spectra_data/{puo}_SONIC_spectrum_data.csv")
-        ln2 = ax[i // 4, i % 4].plot(df["frequencies"], roll_mean(df["wind_z_spec"], win_len=10), 
-                        lw=0.5, c="g", label="Vertikalwind in m/s (2 Hz)")
+        ln2 = ax[i // 4, i % 4].plot(sonic_df["frequencies"], roll_mean(sonic_df["wind_z_spec"], win_len=10), 
+                        lw=0.5, c="g", rasterized=True, label="Vertikalwind in m/s (2 Hz)")
             
-        _, _, start_datetime, end_datetime, date, _ = metadata(puo)
-        ax[i // 4, i % 4].set_title(f"{date}: {start_datetime[10:-3]} - {end_datetime[10:-3]}", **title_kwargs)
-        
-        ax[i // 4, i % 4].set_xlim((1e-4, 1e-1))
-        ax[i // 4, i % 4].set_xticks([1e-4, 1e-3, 1e-2, 1e-1])
-        ax[i // 4, i % 4].set_xscale("log")
-        ax[i // 4, i % 4].set_xlabel("Frequenz [Hz]")
-        ax[i // 4, i % 4].grid()
-        
-        ax2 = ax[i // 4, i % 4].secondary_xaxis(-0.35, functions=(lambda x: 1/x, lambda x: 1/x))
-        ax2.set_xticks([10000, 1000, 100, 10])
-        ax2.set_xlabel("Periodendauer [s]")
-    
-    
-    fig.text(-0.02, 0.5, "Spektrale Energiedichte * Frequenz", va='center', rotation='vertical', fontsize=12)
-    ax[2, 3].axis('off')
     lns = ln1+ln2
     labs = [l.get_label() for l in lns]
     leg = ax[2, 3].legend(lns, labs, loc="center", fontsize="14")
@@ -238,7 +270,7 @@ def plot_wind_spectrum_comp() -> None:
         line.set_linewidth(4.0)
             
     plt.tight_layout()
-    plt.savefig(f"plots/spectra_comparison/spectra_temporal_comparison_SONIC_wind.png", dpi=600, bbox_inches="tight")
+    plt.savefig(f"plots/spectra_comparison/spectra_temporal_comparison_SONIC_wind.png", dpi=SAVE_DPI, bbox_inches="tight")
     plt.close()
 
 
@@ -246,7 +278,7 @@ def plot_wind_spectrum_comp() -> None:
 def plot_avg(x: np.ndarray, y: np.ndarray, device: str, title: str, fn: str) -> dict:
     """Plots the average of a time series."""
 
-    fig, ax = plt.subplots(nrows=3, ncols=1, figsize=(10,7))
+    fig, ax = plt.subplots(nrows=3, ncols=1, figsize=(10,7), constrained_layout=True)
     fig.suptitle(title, **title_kwargs)
     
     colors = ["b", "cyan", "gold", "orange", "r"]
@@ -255,7 +287,7 @@ def plot_avg(x: np.ndarray, y: np.ndarray, device: str, title: str, fn: str) ->
     # plot detrended signal
     ax[0].set_title("A. Trendbereinigtes Signal", loc="left")
     y_det = detrend_signal(y)
-    ax[0].plot(x, y_det, color="grey", lw=lw[device])
+    ax[0].plot(x, y_det, color="grey", lw=lw[device], rasterized=True)
     ax[0].xaxis.set_major_formatter(DateFormatter('%H:%M'))
     
     
@@ -270,17 +302,17 @@ def plot_avg(x: np.ndarray, y: np.ndarray, device: str, title: str, fn: str) ->
         # plot rolling mean
         ax[1].set_title("B. Gleitendes Mittel verschiedener Fensterbreiten", loc="left")    
         y_roll = roll_mean(y_det, win_len)
-        ax[1].plot(x, y_roll, color=colors[i], lw=lw[device], 
+        ax[1].plot(x, y_roll, color=colors[i], lw=lw[device], rasterized=True, 
                    label=f"{WINDOWS_MIN[i]} min")
         ax[1].xaxis.set_major_formatter(DateFormatter('%H:%M'))
         
         # calculate error metrics
-        diff = [i-j for i, j in zip(y_roll, ref)]
+        diff = y_roll - ref
         diff_lists.append(diff)
-        error_metrics["Std"].append(np.round(np.sum([x**2 for x in diff])/(len(ref)-1), 2))
-        error_metrics["Lower Range"].append(np.round(np.min(diff), 2))
-        error_metrics["Upper Range"].append(np.round(np.max(diff), 2))
-        error_metrics["Mean"].append(np.round(np.mean(diff), 2))
+        error_metrics["Std"].append(round(float(diff @ diff)/(len(ref)-1), 2))
+        error_metrics["Lower Range"].append(round(float(diff.min()), 2))
+        error_metrics["Upper Range"].append(round(float(diff.max()), 2))
+        error_metrics["Mean"].append(round(float(diff.mean()), 2))
 
     # plot deviation from reference    
     # sns.violinplot(data=diff_lists, ax=ax[2], palette=colors, 
@@ -289,15 +321,15 @@ def plot_avg(x: np.ndarray, y: np.ndarray, device: str, title: str, fn: str) ->
     #                )
     
     # create a boxplot instead of violinplot with each box have a single color from colors
-    for i, diff_list in enumerate(diff_lists):
-        ax[2].boxplot(diff_list, positions=[i], widths=0.25, notch=True, showfliers=False,
-                      patch_artist=True, 
-                      boxprops=dict(facecolor=colors[i], color="k", alpha=0.6),
-                      medianprops=dict(color="k"),
-                      whiskerprops=dict(color="k"),
-                      capprops=dict(color="k"),
-                    #   flierprops=dict(color=colors[i], markeredgecolor="k"),
-                      )
+    bplots = ax[2].boxplot(diff_lists, positions=np.arange(len(diff_lists)), widths=0.25, 
+                           notch=True, showfliers=False, patch_artist=True, 
+                           boxprops=dict(color="k", alpha=0.6),
+                           medianprops=dict(color="k"),
+                           whiskerprops=dict(color="k"),
+                           capprops=dict(color="k"),
+                           )
+    for patch, color in zip(bplots["boxes"], colors):
+        patch.set_facecolor(color)
     
         
     ax[2].set_title(f"C. Abweichung vom Referenzwert ({MITTELUNGSINTERVALL} min - Mittel)", loc="left")
@@ -308,8 +340,7 @@ def plot_avg(x: np.ndarray, y: np.ndarray, device: str, title: str, fn: str) ->
     for row_i in [0, 1, 2]:
         ax[row_i].grid(True)
     
-    plt.tight_layout()
-    plt.savefig(f"plots/averaging/{fn}_{MITTELUNGSINTERVALL}min.png", dpi=600, bbox_inches="tight")
+    plt.savefig(f"plots/averaging/{fn}_{MITTELUNGSINTERVALL}min.png", dpi=SAVE_DPI, bbox_inches="tight")
     plt.close()
     return error_metrics
 
@@ -337,7 +368,7 @@ def plot_win() -> None:
         ax[i//4, i%4].grid(which="both", axis="both", alpha=0.2)
 
     ax[0, 0].legend(loc='center')
-    plt.savefig("plots/sensitivity_wf/window_functions.png", dpi=600, bbox_inches="tight")
+    plt.savefig("plots/sensitivity_wf/window_functions.png", dpi=SAVE_DPI, bbox_inches="tight")
     plt.close()
 
 def plot_win_influence(x: np.ndarray, y: np.ndarray, title: str, fn: str) -> None:
@@ -348,19 +379,21 @@ def plot_win_influence(x: np.ndarray, y: np.ndarray, title: str, fn: str) -> Non
     
     fig.suptitle(title, **title_kwargs)
     
+    # taper the detrended signal with every window function and 
+    # calculate all spectra in one batched transform
+    y_det = detrend_signal(y)
+    y_tap = np.stack([taper_signal(y_det, 0.1, func=wf) for wf in window_functions])
+    freq, specs = calc_spectrum(x, y_tap)
+    specs_roll = roll_mean(specs, win_len=10, axis=-1)
+    
     for i, wf in enumerate(window_functions):
-        freq, spec = calc_spectrum(x, taper_signal(detrend_signal(y), 0.1, func=wf))
-        spec_roll = roll_mean(spec, win_len=10)
-        
-        ax[i//4, i%4].plot(freq, spec_roll, 
+        ax[i//4, i%4].plot(freq, specs_roll[i], 
                            label=wf.__name__, c="navy", lw=0.4)
-        ax[i//4, i%4].set_xscale("log")
-        ax[i//4, i%4].set_xlim((1e-4, 1e-1))
-        ax[i//4, i%4].set_xticks([1e-4, 1e-3, 1e-2, 1e-1])
+        _style_spec_ax(ax[i//4, i%4])
         ax[i//4, i%4].set_title(wf.__name__)
         ax[i//4, i%4].grid(which="both", axis="both", alpha=0.2)
 
-    plt.savefig(f"plots/sensitivity_wf/{fn}.png", dpi=600, bbox_inches="tight")
+    plt.savefig(f"plots/sensitivity_wf/{fn}.png", dpi=SAVE_DPI, bbox_inches="tight")
     plt.close()
 
 def plot_temporal_coverage() -> None:
@@ -370,6 +403,12 @@ def plot_temporal_coverage() -> None:
                          sharex=False, sharey=True, 
                          gridspec_kw = {'wspace':0, 'hspace':1})
     
+    # time ranges of the puos (day index, start, end), parsed in one batch
+    puo_meta = [metadata(puo) for puo in all_puos]
+    starts = pd.to_datetime([m[2] for m in puo_meta], format="%Y-%m-%d %H:%M:%S", cache=True)
+    ends = pd.to_datetime([m[3] for m in puo_meta], format="%Y-%m-%d %H:%M:%S", cache=True)
+    ranges = [(m[5]-1, start, end) for m, start, end in zip(puo_meta, starts, ends)]
+    
     for i in range(len(unique_dates)):
         row_i = i // 3
         col_i = i % 3
@@ -387,22 +426,15 @@ def plot_temporal_coverage() -> None:
         # plot data
         lns1 = ax[row_i, col_i].plot(
             sonic_dt, sonic_t, label="SONIC Temperatur", 
-            lw=0.3, ls = "solid", alpha=0.6, c="darkblue")
+            lw=0.3, ls = "solid", alpha=0.6, c="darkblue", rasterized=True)
         lns2 = ax[row_i, col_i].plot(
             expe_dt, expe_t, label="EXPE Temperatur", 
-            lw=0.5, ls="solid", alpha=0.6, c="blue")
+            lw=0.5, ls="solid", alpha=0.6, c="blue", rasterized=True)
         lns3 = ax2.plot(
             sonic_dt, sonic_h, label="SONIC Horizontalwind",
-            lw=0.3, alpha=0.6, c="r", )
+            lw=0.3, alpha=0.6, c="r", rasterized=True)
     
         # highlight puos
-        ranges = []
-        for puo in all_puos:
-            _, _, start_date, end_date, _, day = metadata(puo)
-            start = pd.to_datetime(start_date, format="%Y-%m-%d %H:%M:%S")
-            end = pd.to_datetime(end_date, format="%Y-%m-%d %H:%M:%S")
-            ranges.append((day-1, start, end))
-            
         for j in range(len(ranges)): 
             ax_i, start, end = ranges[j]
             if ax_i == i:
@@ -443,7 +475,7 @@ def plot_temporal_coverage() -> None:
         
     plt.tight_layout()
     plt.savefig("plots/temporal_coverage/temporal_coverage.png", 
-                dpi=600, bbox_inches='tight')
+                dpi=SAVE_DPI, bbox_inches='tight')
     plt.close()
 
 
@@ -453,7 +485,7 @@ def plot_patterns(period: str) -> None:
     _, ax = plt.subplots(1, 1, figsize=(8, 5))
     
     # read spectra data
-    df = pd.read_csv(f"data/spectra_data/{period}_comparison_spectrum_data.csv")
+    df = _spec_df(period, "comparison")
     
     # norm spectra
     df = (df-df.min())/(df.max()-df.min())
@@ -493,33 +525,23 @@ def plot_patterns(period: str) -> None:
     plt.ylim(bottom=-0.1)
     plt.ylabel("Spektrale Energiedichte * Frequenz (min-max-normiert)")
     plt.xlabel("Frequenz [Hz]")
-    plt.xscale("log")
-    plt.xlim((1e-4, 1e-1))
-    plt.xticks([1e-4, 1e-3, 1e-2, 1e-1])
+    _style_spec_ax(ax, sec_pos=-0.15)
     plt.legend(loc="upper left")
     plt.grid()
-    ax2 = ax.secondary_xaxis(-0.15, functions=(lambda x: 1/x, lambda x: 1/x))
-    ax2.set_xticks([10000, 1000, 100, 10])
-    ax2.set_xlabel("Periodendauer [s]")
-    plt.savefig(f"plots/spectra_comparison/spectra_variable_comparison_{period}.png", bbox_inches="tight", dpi=600)
+    plt.savefig(f"plots/spectra_comparison/spectra_variable_comparison_{period}.png", bbox_inches="tight", dpi=SAVE_DPI)
     plt.close()
     
     
     # correlation matrix
     _, ax = plt.subplots(1, 1, figsize=(7.5, 6))
     
-    # read spectra data
-    df = pd.read_csv(f"data/spectra_data/{period}_comparison_spectrum_data.csv")
-    
-    # norm spectra
-    df = (df-df.min())/(df.max()-df.min())
-    
-    # reduce spectra to first n rows
-    df = df.iloc[:first_n, :]
-    df = df.iloc[:, 1:]
+    # read first n rows of spectra data, min-max normalization is skipped 
+    # because it does not change the correlation
+    df = _spec_df(period, "comparison", columns=spec_cols, nrows=first_n)
     
     # calculate rolling mean
-    df = df.apply(roll_mean, win_len=10)
+    df = pd.DataFrame(roll_mean(df.to_numpy(), win_len=10, axis=0), 
+                      index=df.index, columns=df.columns)
     
     # rename columns
     df = df.rename(columns=rename_dict)
@@ -537,32 +559,31 @@ def plot_patterns(period: str) -> None:
                 linewidths=.5,
                 cmap="vlag", vmin=-1, vmax=1,
                 )
-    plt.savefig(f"plots/spectra_comparison/spectra_variable_comparison_corr_{period}.png", bbox_inches="tight", dpi=600)
+    plt.savefig(f"plots/spectra_comparison/spectra_variable_comparison_corr_{period}.png", bbox_inches="tight", dpi=SAVE_DPI)
     plt.close()
 
     
+def _puo_spectra(period: str, columns: list[str]) -> np.ndarray:
+    """Return the smoothed spectra (first_n rows) of a period as array."""
+    
+    df = _spec_df(period, "comparison", columns=columns, nrows=first_n)
+    arr = df.to_numpy(dtype=np.float64)
+    return roll_mean(arr, win_len=10, axis=0)
+
 def plot_mean_corr():
     """Plots the mean correlation matrix of all periods under observation."""
     
-    # calculate mean correlation
-    corr_dfs = []
-    for period in all_puos:
-        df = pd.read_csv(f"data/spectra_data/{period}_comparison_spectrum_data.csv")
-        
-        # reduce spectra to first 300 rows
-        
-        df = df.iloc[:first_n, :]
-        df = df.apply(roll_mean, win_len=10)
-        
-
-        df = df.rename(columns=rename_dict)
-        df = df.iloc[:, 1:]
-        df = (df-df.min())/(df.max()-df.min())
-        corr_dfs.append(df.corr(method="pearson"))
-        
+    # load smoothed spectra of all periods, shape (periods, rows, columns)
+    arr = np.stack([_puo_spectra(puo, spec_cols) for puo in all_puos])
+    
+    # Pearson correlation per period via standardized spectra, the min-max 
+    # normalization does not change the correlation and is therefore skipped
+    z = (arr - arr.mean(axis=1, keepdims=True)) / arr.std(axis=1, keepdims=True)
+    corr = np.einsum("pni,pnj->pij", z, z) / z.shape[1]
+    
     # calculate mean correlation 
-    df_corr = pd.concat(corr_dfs).groupby(level=0).mean()
-    df_corr = df_corr.reindex(index=df_corr.columns)
+    corr_labels = [rename_dict[col] for col in spec_cols]
+    df_corr = pd.DataFrame(corr.mean(axis=0), index=corr_labels, columns=corr_labels)
     
     # Plot correlation matrix
     plt.figure(figsize=(7.5, 6))
@@ -575,7 +596,7 @@ def plot_mean_corr():
                 cmap="vlag", vmin=-1, vmax=1
                 )
     
-    plt.savefig(f"plots/other/correlation_mean.png", bbox_inches="tight", dpi=600)
+    plt.savefig(f"plots/other/correlation_mean.png", bbox_inches="tight", dpi=SAVE_DPI)
     plt.close()
 
 def plot_turb_intensity(which: str) -> None:
@@ -589,27 +610,25 @@ def plot_turb_intensity(which: str) -> None:
         "SONIC_wind_z": "g"
         }
     
+    # 10 min time steps of a whole day
+    x = [f"{str(i).zfill(2)}:{str(j).zfill(2)}" for i in range(24) for j in range(0, 60, 10)]
+    
     for period in all_puos:
         _, _, start_datetime, end_datetime, date, _ = metadata(period)
         if period != "PUO_05":
             for device in ["EXPE", "SONIC"]:
                 df = pd.read_csv(f"data/turbulence_intensity_data/{period}_{device}_turbulence_intensity_data.csv")
-                df["time"] = df["from"].apply(lambda x: x[11:16])
+                df["time"] = df["from"].str.slice(11, 16)
                 
                 for var in variables[device]:
-                    x = [f"{str(i).zfill(2)}:{str(j).zfill(2)}" for i in range(24) for j in range(0, 60, 10)]
-                    y = [np.nan for _ in range(len(x))]
-
-                    for i in range(len(df)):
-                        if which == "abs":
-                            y[x.index(df["time"][i])] = df[f"{var}_abs"][i]
-                        elif which == "rel":
-                            y[x.index(df["time"][i])] = df[f"{var}_rel"][i]
+                    # align to time steps, later rows overwrite earlier ones (empty intervals)
+                    y = df.set_index("time")[f"{var}_{which}"]
+                    y = y[~y.index.duplicated(keep="last")].reindex(x)
                     
-                        plt.scatter(x, y, label=f"{device}: {labels[var]}", 
-                                lw=0.5, color=colors[f"{device}_{var}"], 
-                                alpha=0.5, s=10, zorder=10
-                                )
+                    plt.scatter(x, y.to_numpy(), label=f"{device}: {labels[var]}", 
+                            lw=0.5, color=colors[f"{device}_{var}"], 
+                            alpha=0.5, s=10, zorder=10
+                            )
     
     plt.ylabel("Turbulenzintensität")
     plt.xlabel("Zeit [UTC]")
@@ -625,7 +644,7 @@ def plot_turb_intensity(which: str) -> None:
     plt.legend(by_label.values(), by_label.keys(), loc="lower center", ncol=2,
                bbox_to_anchor=(0.5, 1.0), fontsize=8)
     
-    plt.savefig(f"plots/turbulent_intensity/turbulent_intensity_{which}_without_PUO05.png", dpi=600, bbox_inches="tight")
+    plt.savefig(f"plots/turbulent_intensity/turbulent_intensity_{which}_without_PUO05.png", dpi=SAVE_DPI, bbox_inches="tight")
     plt.close()
     
 def plot_error_metrics(fn: str = "data/avg_error_metrics.csv") -> None:
@@ -703,5 +722,5 @@ def plot_error_metrics(fn: str = "data/avg_error_metrics.csv") -> None:
 
         
     plt.subplots_adjust(wspace=0.05, hspace=0.4)
-    plt.savefig(f"plots/other/error_metrics_{MITTELUNGSINTERVALL}min.png", dpi=600, bbox_inches="tight")
+    plt.savefig(f"plots/other/error_metrics_{MITTELUNGSINTERVALL}min.png", dpi=SAVE_DPI, bbox_inches="tight")
     plt.close()
\ No newline at end of file
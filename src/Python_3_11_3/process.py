@@ -56,7 +56,11 @@ def taper_signal(
 
 def calc_spectrum(x: np.ndarray, y: np.ndarray
                   ) -> tuple[np.ndarray, np.ndarray]:
-    """Return the sample frequencies and spectrum of the signal."""
+    """
+    Return the sample frequencies and spectrum of the signal. For 2D input 
+    (several signals of the same time axis), the spectra are calculated 
+    row-wise in a single batched transform.
+    """
     
     # Sample size
     n = sample_size(x)
@@ -64,32 +68,33 @@ def calc_spectrum(x: np.ndarray, y: np.ndarray
     # Discrete Fourier Transform sample frequencies
     freq = sample_freq(x)
     
-    # 1D Discrete Fourier Transform
-    fft_output = scipy.fft.fft(y)
+    # 1D Discrete Fourier Transform (real input, positive frequencies only)
+    fft_output = scipy.fft.rfft(y, axis=-1, workers=-1)
 
     # Remove first element (mean) and frequencies above Nyquist frequency.
-    fft_output = fft_output[1:n//2]
+    fft_output = fft_output[..., 1:n//2]
     
     # Calculate the square of the norm of each complex number
-    spectrum = np.square(np.abs(fft_output))
+    spectrum = fft_output.real**2 + fft_output.imag**2
 
     # Multiply spectral energy density by frequency
     spectrum *= freq
     
     # Multiply spectrum by 2 to account for negative frequencies
-    spectrum = [i*2 for i in spectrum]
+    spectrum *= 2
     
     return freq, spectrum
 
-def roll_mean(y: np.ndarray, win_len: int, mode: str = "nearest"
+def roll_mean(y: np.ndarray, win_len: int, mode: str = "nearest", axis: int = -1
               ) -> np.ndarray:
     """
     Calculate the rolling mean of the time series (x, y) using 
     a window of length win_len. The mode parameter determines 
     how the input array is extended beyond its boundaries. Default is 
-    'nearest'.
+    'nearest'. For 2D input, axis selects the axis to smooth along.
+    The filter keeps a running sum, so the cost does not depend on win_len.
     """
-    return scipy.ndimage.uniform_filter1d(y, win_len, mode=mode)
+    return scipy.ndimage.uniform_filter1d(y, win_len, axis=axis, mode=mode)
     
 
 def step_mean(y: np.ndarray, win_len: int
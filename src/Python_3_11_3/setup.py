@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 variables = {"EXPE": ["t"], "SONIC": ["t", "wind_z", "wind_h"]}
 
 labels = {
@@ -18,6 +20,7 @@ all_puos = ["PUO_01", "PUO_02", "PUO_03", "PUO_04", "PUO_05", "PUO_06",
             "PUO_07", "PUO_08", "PUO_09", "PUO_10", "PUO_11"]
 
 
+@lru_cache(maxsize=None)
 def metadata(period: str) -> tuple:
     """
     Return metadata for a given period. The period can be a whole day or a